@@ -0,0 +1,156 @@
+# tools/_mall_common.py
+# -*- coding: utf-8 -*-
+"""
+auto_write.py / mall_auto_write.py 공용 헬퍼
+
+두 업로더에 같은 구현이 복사돼 있던 부분을 한 곳으로 모음:
+- 엑셀 행 선택(load_next_row)과 DONE 일괄 기록(mark_done_many)
+- chromedriver 경로 해석/캐시(resolve_service, remember_driver_path)
+- CDP 네트워크 차단 목록(install_network_blocklist)
+한쪽만 고쳐져 드리프트하던 문제와 모듈 중복 파싱 비용을 함께 없앤다.
+"""
+
+from __future__ import annotations
+import os, json, datetime
+from pathlib import Path
+
+from selenium.webdriver.chrome.service import Service
+
+ROOT = Path(__file__).resolve().parent.parent
+DOCS = ROOT / "docs"
+XLSX = DOCS / "data.xlsx"
+DRIVER_CACHE = ROOT / ".cache" / "chromedriver.json"
+
+
+def log(msg: str):
+    print(msg, flush=True)
+
+
+# ──────────────────────────────
+# 엑셀 헬퍼
+# ──────────────────────────────
+# 다음 스캔 시작 행 포인터 — 매일 쌓이는 시트가 수천 행이 되어도 앞부분 재스캔을 생략
+NEXT_ROW_PTR = DOCS / ".next_row"
+
+
+def _read_row_pointer() -> int:
+    try:
+        return max(2, int(NEXT_ROW_PTR.read_text(encoding="utf-8").strip()))
+    except Exception:
+        return 2
+
+
+def _write_row_pointer(row: int):
+    try:
+        NEXT_ROW_PTR.write_text(str(row), encoding="utf-8")
+    except Exception:
+        pass
+
+
+def load_next_row(skip_rows=()):
+    """read_only 스트리밍으로 첫 미업로드 행을 찾아 (행번호, 제목, 본문)을 반환.
+
+    skip_rows: 이번 세션에서 이미 올렸지만 아직 DONE 기록 전인 행 번호들.
+    지난 실행이 남긴 docs/.next_row 포인터부터 스캔을 시작해 처리 완료 구간을
+    건너뛴다. 포인터 이후에 대기 건이 없으면(앞 행 상태를 되돌린 경우 등)
+    전체 스캔으로 폴백하므로 결과는 포인터가 없을 때와 같다.
+    """
+    import openpyxl  # 무거운 모듈은 실제 사용 시점에 로드(콜드스타트 단축)
+
+    if not XLSX.exists():
+        raise FileNotFoundError(f"엑셀 파일이 없습니다: {XLSX}")
+    wb = openpyxl.load_workbook(XLSX, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+
+        def _scan(min_row):
+            for i, (title, body, status) in enumerate(
+                ws.iter_rows(min_row=min_row, max_col=3, values_only=True), start=min_row
+            ):
+                if i in skip_rows:
+                    continue
+                title = (title or "").strip()
+                body = (body or "").strip()
+                status = (status or "").strip().upper()
+                if title and body and status not in ("DONE", "PUBLISHED", "SKIP"):
+                    return i, title, body
+            return None
+
+        start = _read_row_pointer()
+        hit = _scan(start)
+        if hit is None and start > 2:
+            hit = _scan(2)
+        if hit:
+            _write_row_pointer(hit[0])
+            return hit
+        return None, None, None
+    finally:
+        wb.close()
+
+
+def mark_done_many(rows):
+    """여러 행을 한 번의 오픈/저장으로 DONE 처리(행당 전체 재저장 방지)."""
+    import openpyxl
+
+    if not rows:
+        return
+    wb = openpyxl.load_workbook(XLSX)
+    ws = wb.active
+    ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+    for row in rows:
+        ws.cell(row=row, column=3).value = "DONE"
+        ws.cell(row=row, column=4).value = ts
+    wb.save(XLSX)
+
+
+# ──────────────────────────────
+# 크롬 드라이버 공통
+# ──────────────────────────────
+def resolve_service() -> Service | None:
+    """드라이버 해석: CHROMEDRIVER env → 캐시된 경로 → Selenium Manager(인프로세스).
+
+    Selenium 4.6+는 드라이버를 네트워크 조회 없이 스스로 찾으므로
+    webdriver-manager를 거치지 않는다. None이면 Chrome()이 알아서 해석.
+    """
+    env_path = os.getenv("CHROMEDRIVER", "").strip()
+    if env_path and Path(env_path).exists():
+        return Service(env_path)
+    try:
+        cached = json.loads(DRIVER_CACHE.read_text(encoding="utf-8"))
+        path = cached.get("path", "")
+        if path and Path(path).exists():
+            return Service(path)
+    except Exception:
+        pass
+    return None
+
+
+def remember_driver_path(drv):
+    """이번 실행이 실제 사용한 chromedriver 경로를 캐시(다음 실행은 해석 생략)."""
+    try:
+        path = getattr(drv.service, "path", "") or ""
+        if path and Path(path).exists():
+            DRIVER_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            DRIVER_CACHE.write_text(json.dumps({"path": str(path)}), encoding="utf-8")
+    except Exception:
+        pass
+
+
+TRACKER_URL_PATTERNS = [
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+    "*facebook.net*", "*hotjar*",
+]
+HEAVY_ASSET_PATTERNS = ["*.woff", "*.woff2", "*.png", "*.jpg", "*.jpeg", "*.gif"]
+
+
+def install_network_blocklist(drv):
+    """트래커/이미지/폰트 요청을 CDP로 차단 — readyState 완료가 빨라져 대기가 짧아진다."""
+    urls = list(TRACKER_URL_PATTERNS)
+    if os.getenv("LOAD_IMAGES", "").strip() != "1":
+        urls += HEAVY_ASSET_PATTERNS
+    try:
+        drv.execute_cdp_cmd("Network.enable", {})
+        drv.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+    except Exception:
+        # CDP를 못 쓰는 드라이버면 차단 없이 그대로 진행
+        pass
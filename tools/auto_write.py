@@ -1,13 +1,13 @@
 # tools/auto_write.py
 # -*- coding: utf-8 -*-
-"""
+r"""
 재다몰 자동 업로드 (로그인 보장형 단일 스크립트)
 
 기능 요약
 - .env의 프로필로 크롬 실행, 충돌/크래시 시 폴백 프로필로 재시도
 - 로그인 상태 점검 → 미로그인 시:
     * ZAEDA_ID/ZAEDA_PW 있으면 자동 로그인
-    * 없거나 실패하면 수동 로그인 대기(엔터로 계속)
+    * 없거나 실패하면 수동 로그인을 자동 감지할 때까지 대기(--login-timeout, 기본 300초)
 - 글쓰기 페이지 진입:
     * 직접 write URL 접근 시도
     * 실패하면 목록(list) 페이지에서 '글쓰기' 버튼 클릭
@@ -17,7 +17,7 @@
 필요 .env 키
 CHROME_USER_DATA_DIR=C:\Users\...\Google\Chrome\User Data
 CHROME_PROFILE=Profile 18
-CHROME_FALLBACK_DIR=C:\ChromeProfiles\zaeda_selenium
+CHROME_FALLBACK_DIR=C:\ChromeProfiles\zaeda_selenium   (미지정 시 리포 옆 .chrome_profile 재사용)
 ZAEDA_ID=your_id
 ZAEDA_PW=your_password
 """
@@ -25,76 +25,85 @@ ZAEDA_PW=your_password
 from dotenv import load_dotenv
 import os
 import argparse
-import datetime
-import time
 from pathlib import Path
-import openpyxl
 
 from selenium.webdriver import Chrome, ChromeOptions
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.alert import Alert
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import (
-    NoSuchElementException,
     TimeoutException,
     UnexpectedAlertPresentException,
-    WebDriverException,
 )
 
-ROOT = Path(__file__).resolve().parent.parent
-DOCS = ROOT / "docs"
-XLSX = DOCS / "data.xlsx"
+# 두 업로더가 공유하는 엑셀/드라이버 헬퍼 (중복 구현 제거)
+try:
+    from tools._mall_common import (
+        ROOT, log, load_next_row, mark_done_many,
+        resolve_service, remember_driver_path, install_network_blocklist,
+    )
+except ImportError:
+    from _mall_common import (
+        ROOT, log, load_next_row, mark_done_many,
+        resolve_service, remember_driver_path, install_network_blocklist,
+    )
 
 MAX_WAIT = 20
 
-def log(msg: str):
-    print(msg, flush=True)
-
 def wait_ready(drv, timeout=MAX_WAIT):
-    WebDriverWait(drv, timeout).until(
+    # 로컬 크롬은 폴링당 왕복이 싸다 — 기본 500ms 대신 100ms로 발견 지연을 줄임
+    WebDriverWait(drv, timeout, poll_frequency=0.1).until(
         lambda d: d.execute_script("return document.readyState") == "complete"
     )
 
 def accept_all_alerts(drv, limit=3):
+    # switch_to.alert는 알럿이 없으면 즉시 예외로 빠지므로 수락 후 고정 sleep이 필요 없다.
+    # 연쇄 알럿(수락 직후 다음 알럿)도 다음 루프의 switch_to가 바로 잡는다.
     for _ in range(limit):
         try:
             a = drv.switch_to.alert
             txt = a.text
             log(f"⚠ 알럿 감지: {txt}")
             a.accept()
-            time.sleep(0.4)
         except Exception:
             break
 
-# ──────────────────────────────
-# Excel helpers
-# ──────────────────────────────
-def load_next_row():
-    if not XLSX.exists():
-        raise FileNotFoundError(f"엑셀 파일이 없습니다: {XLSX}")
-    wb = openpyxl.load_workbook(XLSX)
-    ws = wb.active
-    for i in range(2, ws.max_row + 1):
-        title = (ws[f"A{i}"].value or "").strip()
-        body = (ws[f"B{i}"].value or "").strip()
-        status = (ws[f"C{i}"].value or "").strip().upper()
-        if title and body and status not in ("DONE", "PUBLISHED", "SKIP"):
-            return wb, ws, i, title, body
-    return wb, ws, None, None, None
-
-def mark_done(wb, ws, row: int):
-    ws[f"C{row}"] = "DONE"
-    ws[f"D{row}"] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-    wb.save(XLSX)
-
 # ──────────────────────────────
 # Driver bootstrap
 # ──────────────────────────────
+def install_dialog_autoaccept(drv):
+    """새 문서마다 alert/confirm/prompt를 선제 수락해 내비게이션마다 돌던 알럿 폴링을 제거."""
+    try:
+        drv.execute_cdp_cmd("Page.enable", {})
+        drv.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument",
+            {"source": "window.alert = () => undefined;"
+                       " window.confirm = () => true;"
+                       " window.prompt = () => null;"},
+        )
+    except Exception:
+        # CDP 미지원이면 기존 accept_all_alerts 경로가 그대로 커버
+        pass
+
+# 매 호출마다 동일한 고정 옵션들 — 한 번만 정의
+_BASE_ARGS = (
+    '--start-maximized',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-extensions',
+    '--disable-popup-blocking',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--remote-allow-origins=*',
+)
+_NO_IMAGE_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
 def build_options(user_dir: str, profile_dirname: str = None):
     opts = ChromeOptions()
+    # drv.get()이 DOMContentLoaded 시점에 반환 — 이미지/트래커 등 트레일링 로드를 기다리지 않음
+    opts.page_load_strategy = "eager"
     if profile_dirname:
         # "User Data" + "Profile 18" 형태
         opts.add_argument(f'--user-data-dir={user_dir}')
@@ -102,14 +111,15 @@ def build_options(user_dir: str, profile_dirname: str = None):
     else:
         # 그냥 하나의 전용 폴더(C:\ChromeProfiles\xxx)를 user-data-dir로 사용하는 경우
         opts.add_argument(f'--user-data-dir={user_dir}')
-    opts.add_argument('--start-maximized')
-    opts.add_argument('--no-first-run')
-    opts.add_argument('--no-default-browser-check')
-    opts.add_argument('--disable-extensions')
-    opts.add_argument('--disable-popup-blocking')
-    opts.add_argument('--disable-dev-shm-usage')
-    opts.add_argument('--disable-gpu')
-    opts.add_argument('--remote-allow-origins=*')
+    for arg in _BASE_ARGS:
+        opts.add_argument(arg)
+    # 성능 옵션: 봇은 렌더링을 볼 필요가 없으므로 이미지 디코드/알림을 끔
+    # (.env: HEADLESS=1 이면 창 없이 실행, LOAD_IMAGES=1 이면 이미지 다시 허용)
+    if os.getenv("HEADLESS", "").strip() == "1":
+        opts.add_argument('--headless=new')
+    if os.getenv("LOAD_IMAGES", "").strip() != "1":
+        opts.add_argument('--blink-settings=imagesEnabled=false')
+        opts.add_experimental_option("prefs", _NO_IMAGE_PREFS)
     # Windows 환경에서 간헐적 크래시 회피
     opts.add_experimental_option("excludeSwitches", ["enable-automation"])
     opts.add_experimental_option('useAutomationExtension', False)
@@ -120,7 +130,9 @@ def setup_driver():
 
     primary_user_dir = os.getenv("CHROME_USER_DATA_DIR", "").strip()
     profile_name = os.getenv("CHROME_PROFILE", "").strip()  # 예: "Profile 18"
-    fallback_dir = os.getenv("CHROME_FALLBACK_DIR", r"C:\ChromeProfiles\zaeda_selenium").strip()
+    # 폴백 프로필은 절대 지우지 않는 고정 경로 — 캐시/쿠키가 살아 있어야
+    # 다음 실행에서 재로그인·자산 재다운로드 없이 바로 진행된다.
+    fallback_dir = os.getenv("CHROME_FALLBACK_DIR", str(ROOT / ".chrome_profile")).strip()
 
     # 1) 우선: User Data + Profile N 조합 시도
     try:
@@ -133,7 +145,10 @@ def setup_driver():
         else:
             raise RuntimeError("CHROME_USER_DATA_DIR 미지정")
 
-        drv = Chrome(service=Service(ChromeDriverManager().install()), options=opts)
+        drv = Chrome(service=resolve_service(), options=opts)
+        remember_driver_path(drv)
+        install_network_blocklist(drv)
+        install_dialog_autoaccept(drv)
         return drv, f"{primary_user_dir} | {profile_name or ''}".strip()
     except Exception as e:
         log(f"[chrome] primary profile failed → {e}")
@@ -142,7 +157,10 @@ def setup_driver():
     try:
         Path(fallback_dir).mkdir(parents=True, exist_ok=True)
         opts = build_options(fallback_dir, None)
-        drv = Chrome(service=Service(ChromeDriverManager().install()), options=opts)
+        drv = Chrome(service=resolve_service(), options=opts)
+        remember_driver_path(drv)
+        install_network_blocklist(drv)
+        install_dialog_autoaccept(drv)
         log(f"[chrome] fallback profile launched: {fallback_dir}")
         log("  ↳ 폴백 창에서 재다몰에 1회 로그인해 두면 이후 자동 유지됩니다.")
         return drv, fallback_dir
@@ -152,6 +170,11 @@ def setup_driver():
 # ──────────────────────────────
 # Login helpers
 # ──────────────────────────────
+# 매 호출마다 재조립하지 않도록 정적 XPath 는 모듈 상수로 고정
+_LOGOUT_XPATH = "//a[contains(.,'로그아웃') or contains(.,'Logout')]"
+_WRITE_XPATH = "//a[contains(.,'글쓰기') or contains(.,'Write')] | //button[contains(.,'글쓰기')]"
+_SUBMIT_XPATH = "//button[contains(.,'등록') or contains(.,'작성') or contains(.,'저장')] | //input[@type='submit']"
+
 def is_logged_in(drv) -> bool:
     """
     재다몰 공통: 로그인 상태면 보통 상단/하단에 '로그아웃' 링크가 있고,
@@ -159,11 +182,11 @@ def is_logged_in(drv) -> bool:
     """
     try:
         # 1) 로그아웃 링크 존재?
-        logout = drv.find_elements(By.XPATH, "//a[contains(.,'로그아웃') or contains(.,'Logout')]")
+        logout = drv.find_elements(By.XPATH, _LOGOUT_XPATH)
         if logout:
             return True
         # 2) 글쓰기 버튼 활성화?
-        write_btns = drv.find_elements(By.XPATH, "//a[contains(.,'글쓰기') or contains(.,'Write')] | //button[contains(.,'글쓰기')]")
+        write_btns = drv.find_elements(By.XPATH, _WRITE_XPATH)
         if write_btns:
             # disabled 속성이 없거나 클릭 가능하면 로그인된 경우가 많음
             try:
@@ -175,6 +198,11 @@ def is_logged_in(drv) -> bool:
     except Exception:
         return False
 
+def _logged_in_after_alerts(drv) -> bool:
+    """WebDriverWait 콜백용: 알럿을 치우고 로그인 여부를 반환."""
+    accept_all_alerts(drv)
+    return is_logged_in(drv)
+
 def try_auto_login(drv, login_url_candidates):
     uid = os.getenv("ZAEDA_ID", "").strip()
     pw = os.getenv("ZAEDA_PW", "").strip()
@@ -188,12 +216,6 @@ def try_auto_login(drv, login_url_candidates):
         except Exception:
             continue
 
-        # id / password 필드 후보
-        input_selectors = [
-            "input[name='mb_id']", "input[name='id']", "input#mb_id", "input#login_id",
-            "input[name='mb_password']", "input[name='password']", "input#mb_password", "input#login_pw",
-        ]
-
         try:
             # 아이디
             id_candidates = drv.find_elements(By.CSS_SELECTOR, "input[name='mb_id'], input[name='id'], input#mb_id, input#login_id")
@@ -206,16 +228,14 @@ def try_auto_login(drv, login_url_candidates):
             id_el.clear(); id_el.send_keys(uid)
             pw_el.clear(); pw_el.send_keys(pw)
 
-            # 로그인 버튼 후보
+            # 로그인 버튼 후보 (유니온 셀렉터로 조회 1회)
             login_btn = None
-            for sel in [
-                "button[type='submit']", "input[type='submit']",
-                "a.btn_login", "button.login", "button#login", "input#login"
-            ]:
-                btns = drv.find_elements(By.CSS_SELECTOR, sel)
-                if btns:
-                    login_btn = btns[0]
-                    break
+            btns = drv.find_elements(
+                By.CSS_SELECTOR,
+                "button[type='submit'], input[type='submit'], a.btn_login, button.login, button#login, input#login",
+            )
+            if btns:
+                login_btn = btns[0]
             if login_btn is None:
                 # 텍스트로 찾기
                 btns = drv.find_elements(By.XPATH, "//button[contains(.,'로그인')] | //a[contains(.,'로그인')] | //input[@type='submit']")
@@ -226,43 +246,56 @@ def try_auto_login(drv, login_url_candidates):
                 continue
 
             login_btn.click()
-            time.sleep(1.0)
-            accept_all_alerts(drv)
-            time.sleep(0.5)
-            # 로그인 성공 판정
-            if is_logged_in(drv):
+            # 로그인 성공 판정 (고정 sleep 대신 상태 확인 즉시 반환)
+            try:
+                WebDriverWait(drv, 10, poll_frequency=0.2).until(_logged_in_after_alerts)
                 log("🔐 자동 로그인 성공")
                 return True
+            except TimeoutException:
+                continue
         except UnexpectedAlertPresentException:
             accept_all_alerts(drv)
         except Exception:
             continue
     return False
 
-def ensure_login(drv, list_url_for_check: str):
+def ensure_login(drv, list_url_for_check: str, login_timeout: int = 300):
     """
     로그인 상태 보장:
     - 현재 페이지에서 로그인 여부 체크
-    - 미로그인 → 자동 로그인 시도 → 실패시 수동 로그인 안내
+    - 미로그인 → 자동 로그인 시도 → 실패시 수동 로그인 대기(login_timeout 초)
     """
+    # 이미 재다몰 페이지 위라면(웜 프로필) 확인용 페이지 로드를 생략
     try:
-        drv.get(list_url_for_check)
-        wait_ready(drv)
+        on_site = drv.current_url.startswith("https://zae-da.com")
     except Exception:
-        pass
+        on_site = False
+    if on_site:
+        try:
+            # 네비게이션 없이 JS 한 번으로 로그아웃 링크 존재 확인
+            if drv.execute_script("return !!document.querySelector(\"a[href*='logout']\")"):
+                log("🔓 이미 로그인 상태입니다.")
+                return
+        except Exception:
+            pass
+    else:
+        try:
+            drv.get(list_url_for_check)
+            wait_ready(drv)
+        except Exception:
+            pass
 
     if is_logged_in(drv):
         log("🔓 이미 로그인 상태입니다.")
         return
 
     # 자동 로그인 시도
+    # 홈(/, /m/)은 로그인 폼이 없어 페이지 로드만 낭비하므로 후보에서 제외
     login_urls = [
         "https://zae-da.com/m/bbs/login.php",
         "https://zae-da.com/m/member/login.php",
         "https://zae-da.com/bbs/login.php",
         "https://zae-da.com/member/login.php",
-        "https://zae-da.com/m/",
-        "https://zae-da.com/",
     ]
     if try_auto_login(drv, login_urls):
         return
@@ -280,11 +313,11 @@ def ensure_login(drv, list_url_for_check: str):
         except Exception:
             pass
 
-    input("재다몰에 수동 로그인 후 엔터를 눌러 계속하세요... ")
-    # 로그인 여부 재확인
-    drv.get(list_url_for_check)
-    wait_ready(drv)
-    if not is_logged_in(drv):
+    # 엔터 입력 대신 로그인 상태를 폴링 — 로그인 완료 즉시 자동 진행
+    log(f"대기 중: 로그인 감지 시 자동 진행 (최대 {login_timeout}초)")
+    try:
+        WebDriverWait(drv, login_timeout, poll_frequency=1.0).until(_logged_in_after_alerts)
+    except TimeoutException:
         raise RuntimeError("로그인이 확인되지 않았습니다. 수동 로그인 후 다시 시도해주세요.")
 
 # ──────────────────────────────
@@ -294,7 +327,6 @@ def goto_write_from_list(drv, list_url: str) -> bool:
     try:
         drv.get(list_url)
         wait_ready(drv)
-        accept_all_alerts(drv)
 
         # 글쓰기 버튼 후보들
         candidates = [
@@ -311,8 +343,6 @@ def goto_write_from_list(drv, list_url: str) -> bool:
                 try:
                     if b.is_enabled():
                         b.click()
-                        time.sleep(0.4)
-                        accept_all_alerts(drv)
                         wait_ready(drv)
                         # 도착 확인: 보통 subject 필드가 존재
                         if find_subject(drv) is not None:
@@ -325,40 +355,69 @@ def goto_write_from_list(drv, list_url: str) -> bool:
     except Exception:
         return False
 
+# 후보 셀렉터를 브라우저 안에서 한 번에 훑고 첫 매치만 돌려받는다 (N회 왕복 → 1회)
+_FIRST_MATCH_JS = (
+    "for (const s of arguments[0]) {"
+    "  const el = document.querySelector(s);"
+    "  if (el) return el;"
+    "}"
+    "return null;"
+)
+
+# send_keys는 글자당 CDP 왕복이라 2000자 본문이면 2000회 — 값 설정은 JS 한 번으로
+_SET_VALUE_JS = (
+    "arguments[0].value = arguments[1];"
+    "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+    "arguments[0].dispatchEvent(new Event('change', {bubbles: true}));"
+)
+
+def set_input_value(drv, el, text: str):
+    drv.execute_script(_SET_VALUE_JS, el, text)
+
+# 그누보드 계열은 필드명이 고정(wr_subject/wr_content)이라 이름 매치가 최우선,
+# 그 다음 글쓰기 폼(#fboardform) 범위로 좁힌 뒤에야 페이지 전역 후보로 넓힌다.
+SUBJECT_SELECTORS = [
+    "input[name='wr_subject']",
+    "input[name='subject']",
+    "input[name='title']",
+    "input#wr_subject",
+    "input#subject",
+    "input#title",
+    "#fboardform input[type='text']",
+]
+
+BODY_TEXTAREA_SELECTORS = [
+    "textarea[name='wr_content']",
+    "textarea#wr_content",
+    "textarea[name='content']",
+    "textarea#content",
+    "#fboardform textarea",
+    "textarea",
+]
+
+BODY_EDITOR_SELECTORS = [
+    "div[contenteditable='true']",
+    "div.se2_inputarea",         # SmartEditor
+    "iframe",                    # iframe 기반 에디터
+]
+
 def find_subject(drv):
-    sels = [
-        "input[name='wr_subject']",
-        "input[name='subject']",
-        "input[name='title']",
-        "input#wr_subject",
-        "input#subject",
-        "input#title",
-    ]
-    for sel in sels:
-        els = drv.find_elements(By.CSS_SELECTOR, sel)
-        if els:
-            return els[0]
-    return None
+    try:
+        return drv.execute_script(_FIRST_MATCH_JS, SUBJECT_SELECTORS)
+    except Exception:
+        return None
 
 def find_body_targets(drv):
-    # textarea 우선, 없으면 contenteditable
-    ta = drv.find_elements(By.CSS_SELECTOR, "textarea[name='wr_content'], textarea[name='content'], textarea#wr_content, textarea#content, textarea")
-    if ta:
-        return ("textarea", ta[0])
-
-    ed = None
-    # 대표적인 에디터 컨테이너
-    for sel in [
-        "div[contenteditable='true']",
-        "div.se2_inputarea",         # SmartEditor
-        "iframe",                    # iframe 기반 에디터
-    ]:
-        els = drv.find_elements(By.CSS_SELECTOR, sel)
-        if els:
-            ed = els[0]
-            break
-    if ed is not None:
-        return ("editor", ed)
+    # textarea 우선, 없으면 contenteditable/iframe — 판정 전체를 JS 한 번으로 처리
+    try:
+        ta = drv.execute_script(_FIRST_MATCH_JS, BODY_TEXTAREA_SELECTORS)
+        if ta is not None:
+            return ("textarea", ta)
+        ed = drv.execute_script(_FIRST_MATCH_JS, BODY_EDITOR_SELECTORS)
+        if ed is not None:
+            return ("editor", ed)
+    except Exception:
+        pass
     return (None, None)
 
 def ensure_write_page(drv, list_url: str, write_url: str) -> None:
@@ -369,7 +428,6 @@ def ensure_write_page(drv, list_url: str, write_url: str) -> None:
     try:
         drv.get(write_url)
         wait_ready(drv)
-        accept_all_alerts(drv)
         if find_subject(drv) is not None:
             log("✅ 글쓰기 페이지(직접 URL) 진입 성공")
             return
@@ -385,6 +443,50 @@ def ensure_write_page(drv, list_url: str, write_url: str) -> None:
 # ──────────────────────────────
 # Main
 # ──────────────────────────────
+def publish_one(drv, title: str, body: str):
+    """현재 글쓰기 페이지에 제목/본문을 채우고 제출까지 수행."""
+    # 제목 입력
+    ti = find_subject(drv)
+    if not ti:
+        raise RuntimeError("제목 입력 필드를 찾을 수 없습니다.")
+    set_input_value(drv, ti, title)
+    log("제목 입력 완료 ✓")
+
+    # 본문 입력
+    kind, target = find_body_targets(drv)
+    if kind == "textarea":
+        set_input_value(drv, target, body)
+        log("본문 입력 완료 ✓ (textarea)")
+    elif kind == "editor":
+        body_html = body.replace("\n", "<br>")  # 분기와 무관하게 한 번만 변환
+        tag_name = target.tag_name.lower()
+        if tag_name == "iframe":
+            # iframe 에디터인 경우
+            drv.switch_to.frame(target)
+            try:
+                ed = drv.find_element(By.CSS_SELECTOR, "body[contenteditable='true'], body")
+                drv.execute_script("arguments[0].innerHTML = arguments[1];", ed, body_html)
+                log("본문 입력 완료 ✓ (iframe editor)")
+            finally:
+                drv.switch_to.default_content()
+        else:
+            drv.execute_script("arguments[0].innerHTML = arguments[1];", target, body_html)
+            log("본문 입력 완료 ✓ (contenteditable/editor)")
+    else:
+        raise RuntimeError("본문 입력 필드를 찾을 수 없습니다.")
+
+    # 제출 버튼 (유니온 XPath 로 조회 1회)
+    btns = drv.find_elements(By.XPATH, _SUBMIT_XPATH)
+    if not btns:
+        raise RuntimeError("제출 버튼을 찾을 수 없습니다.")
+    submit_btn = btns[0]
+
+    submit_btn.click()
+    accept_all_alerts(drv)
+    wait_ready(drv)
+
+    log("등록 버튼 클릭 ✓")
+
 def main():
     load_dotenv()
 
@@ -393,85 +495,38 @@ def main():
     ap.add_argument("--list-url", default="https://zae-da.com/bbs/list.php?boardid=41", help="글 목록 URL(글쓰기 버튼 누르기용)")
     ap.add_argument("--keep-open", action="store_true", default=True, help="종료 후 브라우저 유지")
     ap.add_argument("--no-excel", action="store_true", help="엑셀 대신 테스트 텍스트 사용")
+    ap.add_argument("--batch", type=int, default=1, help="한 크롬 세션에서 연속 업로드할 최대 건수")
+    ap.add_argument("--login-timeout", type=int, default=300, help="수동 로그인 감지 대기 시간(초)")
     args = ap.parse_args()
 
     drv, profile_info = setup_driver()
     log(f"프로필 정보: {profile_info}")
 
+    done_rows = []
     try:
-        # 로그인 보장
-        ensure_login(drv, args.list_url)
-
-        # 글쓰기 페이지 진입
-        ensure_write_page(drv, args.list_url, args.url)
+        # 로그인 보장 (드라이버/로그인 비용은 배치 전체에 1회만 지불)
+        ensure_login(drv, args.list_url, login_timeout=args.login_timeout)
 
-        # 콘텐츠 준비
         if args.no_excel:
-            title = "테스트 제목입니다 (자동화)"
-            body = "테스트 본문 입니다.\n자동화 확인용."
-            wb = ws = row = None
-        else:
-            wb, ws, row, title, body = load_next_row()
-            if not row:
-                log("대기 중인 업로드 건이 없습니다.")
-                return
-
-        # 제목 입력
-        ti = find_subject(drv)
-        if not ti:
-            raise RuntimeError("제목 입력 필드를 찾을 수 없습니다.")
-        ti.clear()
-        ti.send_keys(title)
-        log("제목 입력 완료 ✓")
-
-        # 본문 입력
-        kind, target = find_body_targets(drv)
-        if kind == "textarea":
-            target.clear()
-            target.send_keys(body)
-            log("본문 입력 완료 ✓ (textarea)")
-        elif kind == "editor":
-            tag_name = target.tag_name.lower()
-            if tag_name == "iframe":
-                # iframe 에디터인 경우
-                drv.switch_to.frame(target)
-                try:
-                    ed = drv.find_element(By.CSS_SELECTOR, "body[contenteditable='true'], body")
-                    drv.execute_script("arguments[0].innerHTML = arguments[1];", ed, body.replace("\n","<br>"))
-                    log("본문 입력 완료 ✓ (iframe editor)")
-                finally:
-                    drv.switch_to.default_content()
-            else:
-                drv.execute_script("arguments[0].innerHTML = arguments[1];", target, body.replace("\n","<br>"))
-                log("본문 입력 완료 ✓ (contenteditable/editor)")
+            ensure_write_page(drv, args.list_url, args.url)
+            publish_one(drv, "테스트 제목입니다 (자동화)", "테스트 본문 입니다.\n자동화 확인용.")
         else:
-            raise RuntimeError("본문 입력 필드를 찾을 수 없습니다.")
-
-        # 제출 버튼
-        submit_btn = None
-        for sel in [
-            "//button[contains(.,'등록') or contains(.,'작성') or contains(.,'저장')]",
-            "//input[@type='submit']",
-        ]:
-            btns = drv.find_elements(By.XPATH, sel)
-            if btns:
-                submit_btn = btns[0]
-                break
-
-        if submit_btn is None:
-            raise RuntimeError("제출 버튼을 찾을 수 없습니다.")
-
-        submit_btn.click()
-        time.sleep(0.5)
-        accept_all_alerts(drv)
-        wait_ready(drv)
+            while len(done_rows) < args.batch:
+                row, title, body = load_next_row(skip_rows=done_rows)
+                if not row:
+                    if not done_rows:
+                        log("대기 중인 업로드 건이 없습니다.")
+                    else:
+                        log("대기 중인 업로드 건을 모두 처리했습니다.")
+                    break
 
-        log("등록 버튼 클릭 ✓")
+                # 글쓰기 페이지 진입 후 1건 발행
+                ensure_write_page(drv, args.list_url, args.url)
+                publish_one(drv, title, body)
 
-        # 엑셀 DONE 표시
-        if 'wb' in locals() and wb and ws and row:
-            mark_done(wb, ws, row)
-            log("✅ 업로드 완료 → DONE 처리")
+                # DONE 반영은 세션 종료 시 일괄 저장(행당 전체 파일 재저장 방지)
+                done_rows.append(row)
+                log(f"✅ 업로드 완료 ({len(done_rows)}/{args.batch})")
 
     except UnexpectedAlertPresentException:
         try:
@@ -483,6 +538,14 @@ def main():
     except Exception as e:
         log(f"❌ 오류: {e}")
     finally:
+        # 이번 세션에서 발행된 행들을 한 번에 DONE 반영 (오류로 중단돼도 보존)
+        try:
+            mark_done_many(done_rows)
+            if done_rows:
+                log(f"엑셀 DONE 일괄 반영: {len(done_rows)}건")
+        except Exception as e:
+            log(f"⚠ 엑셀 DONE 반영 실패: {e} (행: {done_rows})")
+
         if args.keep_open:
             log("브라우저는 열어둡니다. 작업 내용을 확인하세요.")
         else:
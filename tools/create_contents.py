@@ -9,7 +9,8 @@
 """
 
 from __future__ import annotations
-import os, re, datetime, argparse
+import os, re, json, datetime, argparse, collections, hashlib, shelve, threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 from dotenv import load_dotenv
@@ -32,11 +33,42 @@ CATEGORIES = {
     "생활습관 관리": ["식습관", "운동 습관", "배변 습관", "음주 습관", "금연"],
 }
 
+# (카테고리1, 카테고리2) 전체 조합 — 매 실행 재조립 대신 모듈 로드 시 한 번
+ALL_PAIRS = tuple((c1, c2) for c1, subs in CATEGORIES.items() for c2 in subs)
+
 FORBIDDEN_WORDS = ["100% 예방", "충격", "완치"]
 
+# 행마다 재컴파일/재스캔하지 않도록 모듈 로드 시 한 번만 컴파일
+_WS_RE = re.compile(r"\s+")
+_FORBIDDEN_RE = re.compile("|".join(map(re.escape, FORBIDDEN_WORDS)))
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 모델 클라이언트 (gemini_client 우선, 없으면 더미)
 # ─────────────────────────────────────────────────────────────────────────────
+# 더미 응답/디스클레이머 — 호출마다 재조립하지 않도록 모듈 상수로 고정
+_FALLBACK_TEXT = (
+    "후크: 요즘 일상이 바쁜데도 증상 때문에 고생하고 계신가요? "
+    "출퇴근, 카톡 알림 사이에서도 몸은 신호를 보냅니다. 오늘은 핵심 원인과 "
+    "일상에서 시작할 수 있는 변화를 쉽게 풀어 드릴게요.\n\n"
+    "왜 중요한가: 우리 몸은 호르몬과 자율신경의 균형으로 하루 컨디션을 유지합니다. "
+    "작은 습관의 누적이 집중력, 수면, 대인관계에 영향을 줍니다. 최근 연구에서도 "
+    "생활습관 중재가 유의미한 변화를 만든다고 보고합니다.\n\n"
+    "1) 물 마시기 루틴 만들기 💧 …\n"
+    "2) 가벼운 걷기 습관 들이기 🚶 …\n"
+    "3) 취침 1시간 전 스크린 줄이기 🌙 …\n\n"
+    "주의사항: 기존 질환이나 약 복용 중이면 변경 전 전문가 상담을 권장드립니다.\n\n"
+    "요약: 오늘부터 쉬운 3가지를 실천하면 일정 기간 후 체감 변화가 옵니다. "
+    "꾸준함이 핵심이에요. 😊\n\n"
+    "근거자료:\n- WHO Lifestyle guidance\n- 질병관리청 자료\n\n"
+    "이 글은 일반적인 건강 정보를 제공하기 위한 것이며, 의료적 진단이나 치료를 "
+    "대신하지 않습니다. 개인별 상태에 따라 전문가 상담이 필요할 수 있습니다."
+)
+
+_DISCLAIMER = (
+    "이 글은 일반적인 건강 정보를 제공하기 위한 것이며, 의료적 진단이나 치료를 대신하지 않습니다. "
+    "개인별 상태에 따라 전문가 상담이 필요할 수 있습니다."
+)
+
 def _load_model():
     try:
         from tools.gemini_client import generate_text  # type: ignore
@@ -51,27 +83,31 @@ def _load_model():
 
     def _fallback(prompt: str, **kwargs) -> str:
         # 아주 간단한 더미. 모델이 없을 때 최소 동작 보장용.
-        return (
-            "후크: 요즘 일상이 바쁜데도 증상 때문에 고생하고 계신가요? "
-            "출퇴근, 카톡 알림 사이에서도 몸은 신호를 보냅니다. 오늘은 핵심 원인과 "
-            "일상에서 시작할 수 있는 변화를 쉽게 풀어 드릴게요.\n\n"
-            "왜 중요한가: 우리 몸은 호르몬과 자율신경의 균형으로 하루 컨디션을 유지합니다. "
-            "작은 습관의 누적이 집중력, 수면, 대인관계에 영향을 줍니다. 최근 연구에서도 "
-            "생활습관 중재가 유의미한 변화를 만든다고 보고합니다.\n\n"
-            "1) 물 마시기 루틴 만들기 💧 …\n"
-            "2) 가벼운 걷기 습관 들이기 🚶 …\n"
-            "3) 취침 1시간 전 스크린 줄이기 🌙 …\n\n"
-            "주의사항: 기존 질환이나 약 복용 중이면 변경 전 전문가 상담을 권장드립니다.\n\n"
-            "요약: 오늘부터 쉬운 3가지를 실천하면 일정 기간 후 체감 변화가 옵니다. "
-            "꾸준함이 핵심이에요. 😊\n\n"
-            "근거자료:\n- WHO Lifestyle guidance\n- 질병관리청 자료\n\n"
-            "이 글은 일반적인 건강 정보를 제공하기 위한 것이며, 의료적 진단이나 치료를 "
-            "대신하지 않습니다. 개인별 상태에 따라 전문가 상담이 필요할 수 있습니다."
-        )
+        return _FALLBACK_TEXT
     return ("fallback", _fallback)
 
 MODEL_NAME, MODEL_FN = _load_model()
 
+# 같은 프롬프트 재실행 시 API 재과금을 피하는 로컬 응답 캐시 (--no-cache 로 비활성)
+# shelve/dbm은 동시 기록이 안전하지 않다(gdbm은 두 번째 쓰기 오픈에서 예외) —
+# 스레드풀에서 호출되므로 파일 접근만 락으로 직렬화하고, 모델 호출은 락 밖에서 겹친다
+_LLM_CACHE = ROOT / ".cache" / "llm_cache"
+_cache_enabled = True
+_cache_lock = threading.Lock()
+
+def _call_model(prompt: str, **kwargs) -> str:
+    if MODEL_NAME != "gemini" or not _cache_enabled:
+        return MODEL_FN(prompt, **kwargs)
+    key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    _LLM_CACHE.parent.mkdir(exist_ok=True)
+    with _cache_lock, shelve.open(str(_LLM_CACHE)) as db:
+        if key in db:
+            return db[key]
+    text = MODEL_FN(prompt, **kwargs)
+    with _cache_lock, shelve.open(str(_LLM_CACHE)) as db:
+        db[key] = text
+    return text
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 지침 프롬프트
 # ─────────────────────────────────────────────────────────────────────────────
@@ -99,7 +135,7 @@ GUIDELINE_PROMPT = """
    - 이유 2–3문장 → 실행법 2문장 → 초보자 팁 1–2문장
 4) 주의사항(150–200자): 특정 질환·약물 복용자 주의 + 흔한 실수 팁
 5) 요약(200–250자): 핵심 행동 요약 + 효과/근거 보강, 이모지 허용
-6) 근거자료(3–6개): WHO/질병관리청/학회/저널 등 목록
+6) 근거자료(3개, 한 줄씩): WHO/질병관리청/학회/저널 등 목록
 
 [디스클레이머] 본문 끝 자동 출력(타이틀 숨김)
 “이 글은 일반적인 건강 정보를 제공하기 위한 것이며, 의료적 진단이나 치료를 대신하지 않습니다. 개인별 상태에 따라 전문가 상담이 필요할 수 있습니다.”
@@ -113,6 +149,12 @@ GUIDELINE_PROMPT = """
 <본문 전체>
 """
 
+# 실제 모델 사용 시 JSON 출력을 요구 — 첫 줄 분리 휴리스틱의 파싱 실패(재시도 비용)를 제거
+_JSON_FORMAT_NOTE = """
+위의 출력 형식 대신, 반드시 아래 JSON 형식으로만 응답하세요(코드블록·설명 금지):
+{"title": "제목(22-30자)", "body": "본문 전체"}
+"""
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 유틸
 # ─────────────────────────────────────────────────────────────────────────────
@@ -129,35 +171,33 @@ def ensure_workbook() -> openpyxl.Workbook:
     wb.save(XLSX)
     return wb
 
-def first_empty_row(ws) -> int:
-    r = ws.max_row + 1
-    # 혹시 마지막 줄이 비어있지 않은데 더미 줄이 있을 때 대비
-    while any((ws[f"{col}{r}"].value for col in "ABCD")):
-        r += 1
-    return r
-
 def sanitize_title(title: str) -> str:
-    t = title.strip()
-    for bad in FORBIDDEN_WORDS:
-        t = t.replace(bad, "")
-    # 한 줄로
-    t = re.sub(r"\s+", " ", t)
-    return t
+    # 금지어 제거 + 한 줄로 (둘 다 사전 컴파일된 패턴 한 번씩)
+    return _WS_RE.sub(" ", _FORBIDDEN_RE.sub("", title.strip()))
 
 def clip_title_len(title: str) -> str:
     # 22~30자 범위에 최대한 맞춤(넘치면 자르고, 너무 짧으면 안전하게 보강)
+    # 자른 자리의 꼬리 공백은 제거 — 시트의 기존 제목은 strip()된 값이라
+    # 공백이 남으면 중복 판정이 어긋나 같은 제목이 다시 추가된다
     t = title
     if len(t) > TITLE_MAX:
-        t = t[:TITLE_MAX]
+        t = t[:TITLE_MAX].rstrip()
     if len(t) < TITLE_MIN:
         t = t + " " + "가볍게 시작해 보세요"
         if len(t) > TITLE_MAX:
-            t = t[:TITLE_MAX]
+            t = t[:TITLE_MAX].rstrip()
     return t
 
 def extract_title_and_body(raw: str) -> Tuple[str, str]:
     raw = raw.strip()
-    # 첫 줄을 제목으로 보고, 나머지를 본문으로
+    # 1순위: JSON 응답 ({"title": ..., "body": ...}) — 파싱 모호성 없음
+    if raw.startswith("{"):
+        try:
+            data = json.loads(raw)
+            return str(data["title"]).strip(), str(data["body"]).strip()
+        except (json.JSONDecodeError, KeyError, TypeError):
+            pass
+    # 폴백: 첫 줄을 제목으로 보고, 나머지를 본문으로
     if "\n" in raw:
         first, rest = raw.split("\n", 1)
     else:
@@ -175,84 +215,111 @@ def wrap_title_with_categories(title: str, cat1: str, cat2: str) -> str:
 # 생성 로직
 # ─────────────────────────────────────────────────────────────────────────────
 def generate_post(cat1: str, cat2: str, topic: Optional[str] = None) -> Tuple[str, str]:
-    topic = topic or f"{cat2} 주제의 생활 관리 가이드"
-    prompt = GUIDELINE_PROMPT.format(topic=topic, cat1=cat1, cat2=cat2)
-
-    text = MODEL_FN(prompt, max_output_tokens=2200) if MODEL_NAME == "gemini" else MODEL_FN(prompt)
+    if MODEL_NAME == "gemini":
+        topic = topic or f"{cat2} 주제의 생활 관리 가이드"
+        prompt = GUIDELINE_PROMPT.format(topic=topic, cat1=cat1, cat2=cat2)
+        # ≈2000자 목표면 1300-1500 토큰 수준 — 출력 토큰이 지연을 지배하므로 여유분 축소
+        text = _call_model(prompt + _JSON_FORMAT_NOTE, max_output_tokens=1600)
+    else:
+        # 더미는 프롬프트를 무시하므로 1.5KB 프롬프트 포맷팅을 건너뜀
+        text = MODEL_FN("")
     title, body = extract_title_and_body(text)
 
     # 제목 정리 & 접두 붙이기
     title = wrap_title_with_categories(title, cat1, cat2)
 
     # 디스클레이머 보장(중복 방지)
-    disclaimer = (
-        "이 글은 일반적인 건강 정보를 제공하기 위한 것이며, 의료적 진단이나 치료를 대신하지 않습니다. "
-        "개인별 상태에 따라 전문가 상담이 필요할 수 있습니다."
-    )
-    if disclaimer not in body:
-        body = body.rstrip() + "\n\n" + disclaimer
+    if _DISCLAIMER not in body:
+        body = body.rstrip() + "\n\n" + _DISCLAIMER
 
     return title, body
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 메인
 # ─────────────────────────────────────────────────────────────────────────────
-def main():
+def main(argv: list[str] | None = None):
     load_dotenv()
 
     ap = argparse.ArgumentParser()
     ap.add_argument("--only-empty", action="store_true", help="빈 행만 채우기")
     ap.add_argument("--count", type=int, default=0, help="새로 생성할 개수(0=카테고리 전체 1회전)")
     ap.add_argument("--topic", type=str, default="", help="사용자 지정 주제(옵션)")
-    args = ap.parse_args()
+    ap.add_argument("--concurrency", type=int, default=8, help="모델 호출 동시 실행 상한")
+    ap.add_argument("--no-cache", action="store_true", help="로컬 응답 캐시 무시하고 항상 새로 생성")
+    args = ap.parse_args(argv)
+
+    if args.no_cache:
+        global _cache_enabled
+        _cache_enabled = False
 
     wb = ensure_workbook()
     ws = wb.active
 
-    to_generate = []
-
+    # 시트를 한 번만 훑어 기존 제목 집합과 빈 행 인덱스를 동시에 수집
+    # → 중복 판정 O(1), --only-empty 빈 칸 찾기도 popleft O(1)
+    existing_titles = set()
+    empty_rows = collections.deque()
+    next_row = 2
+    for i, (title_v, body_v, status_v) in enumerate(
+        ws.iter_rows(min_row=2, max_col=3, values_only=True), start=2
+    ):
+        t = (title_v or "").strip()
+        existing_titles.add(t)
+        if not t and not (body_v or "").strip() and (status_v or "").strip().upper() != "SKIP":
+            empty_rows.append(i)
+        next_row = i + 1
+
+    # --only-empty 일 때는 이미 채워진 카테고리 조합을 모델 호출 전에 걸러냄
+    # (호출 후 버리면 API 왕복만 낭비)
+    existing_prefixes = {
+        t.split("]", 1)[0] + "]" for t in existing_titles if t.startswith("[")
+    }
+
+    def _already_filled(cat1: str, cat2: str) -> bool:
+        return args.only_empty and f"[{cat1}/{cat2}]" in existing_prefixes
+
+    # 사전 계산된 조합 목록을 필터/슬라이스 — 이중 루프와 조기 break 스캐폴딩 제거
+    to_generate = [p for p in ALL_PAIRS if not _already_filled(*p)]
     if args.count > 0:
-        # 카테고리 순회로 n개 생성
-        for cat1, subcats in CATEGORIES.items():
-            for cat2 in subcats:
-                to_generate.append((cat1, cat2))
-                if len(to_generate) >= args.count:
-                    break
-            if len(to_generate) >= args.count:
-                break
+        to_generate = to_generate[: args.count]
+
+    # 모델 호출은 네트워크 대기가 대부분 — 스레드로 겹쳐서 왕복 지연을 숨긴다.
+    # 동시 실행 수는 --concurrency 로 제한 (제공자 레이트리밋 대응)
+    # (더미 폴백은 즉시 반환이라 직렬로 충분)
+    workers = min(max(1, args.concurrency), len(to_generate)) if MODEL_NAME == "gemini" else 1
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(
+                ex.map(lambda cc: generate_post(cc[0], cc[1], args.topic or None), to_generate)
+            )
     else:
-        # 전체 카테고리 1회전
-        for cat1, subcats in CATEGORIES.items():
-            for cat2 in subcats:
-                to_generate.append((cat1, cat2))
+        results = [generate_post(c1, c2, args.topic or None) for c1, c2 in to_generate]
 
     generated = 0
-    for cat1, cat2 in to_generate:
-        if args.only_empty:
-            # 빈 줄 찾아 쓰기
-            row = None
-            for i in range(2, ws.max_row + 1):
-                title = (ws[f"A{i}"].value or "").strip()
-                body = (ws[f"B{i}"].value or "").strip()
-                status = (ws[f"C{i}"].value or "").strip().upper()
-                if not title and not body and status != "SKIP":
-                    row = i
-                    break
-            if row is None:
-                row = ws.max_row + 1
-        else:
-            row = ws.max_row + 1
-
-        title, body = generate_post(cat1, cat2, args.topic or None)
-
-        ws[f"A{row}"] = title
-        ws[f"B{row}"] = body
-        ws[f"C{row}"] = ""  # 상태 비움(업로더가 DONE 처리)
-        ws[f"D{row}"] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-
-        generated += 1
-
-    wb.save(XLSX)
+    # 분 단위 정밀도라 행마다 찍어도 같은 값 — 루프 밖에서 한 번만 포맷
+    ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+    try:
+        for (cat1, cat2), (title, body) in zip(to_generate, results):
+            if title in existing_titles:
+                continue  # 이미 같은 제목이 있으면 행 낭비 없이 건너뜀
+
+            if args.only_empty and empty_rows:
+                # 미리 수집한 빈 행을 덮어쓰기 — 좌표 파싱 없는 cell() 접근
+                row = empty_rows.popleft()
+                ws.cell(row=row, column=1, value=title)
+                ws.cell(row=row, column=2, value=body)
+                ws.cell(row=row, column=3, value="")  # 상태 비움(업로더가 DONE 처리)
+                ws.cell(row=row, column=4, value=ts)
+            else:
+                # 시트 끝 추가는 append 가 문서화된 빠른 경로
+                ws.append([title, body, "", ts])
+                next_row += 1
+
+            existing_titles.add(title)
+            generated += 1
+    finally:
+        # 저장은 전 과정에서 이 한 번뿐 — 중간 Ctrl+C 에도 생성분은 디스크에 남김
+        wb.save(XLSX)
     print(f"✅ 생성 완료: {generated}건 (모델: {MODEL_NAME})  → {XLSX}")
 
 if __name__ == "__main__":
@@ -11,15 +11,12 @@
 
 from __future__ import annotations
 from dotenv import load_dotenv
-import os, sys, time, argparse, datetime
+import os, argparse
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
-import openpyxl
 
 from selenium.webdriver import Chrome, ChromeOptions
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.alert import Alert
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
@@ -30,55 +27,42 @@ from selenium.common.exceptions import (
     UnexpectedAlertPresentException,
 )
 
-from webdriver_manager.chrome import ChromeDriverManager
+# 두 업로더가 공유하는 엑셀/드라이버 헬퍼 (중복 구현 제거)
+try:
+    from tools._mall_common import (
+        log, load_next_row, mark_done_many,
+        resolve_service, remember_driver_path, install_network_blocklist,
+    )
+except ImportError:
+    from _mall_common import (
+        log, load_next_row, mark_done_many,
+        resolve_service, remember_driver_path, install_network_blocklist,
+    )
 
-# ──────────────────────────────
-# 기본 경로/상수
-# ──────────────────────────────
-ROOT = Path(__file__).resolve().parent.parent
-DOCS = ROOT / "docs"
-XLSX = DOCS / "data.xlsx"
 MAX_WAIT = 20
 
 
-def log(msg: str):
-    print(msg, flush=True)
-
-
-# ──────────────────────────────
-# 엑셀 헬퍼
-# ──────────────────────────────
-def load_next_row():
-    if not XLSX.exists():
-        raise FileNotFoundError(f"엑셀 파일이 없습니다: {XLSX}")
-    wb = openpyxl.load_workbook(XLSX)
-    ws = wb.active
-    for i in range(2, ws.max_row + 1):
-        title = (ws[f"A{i}"].value or "").strip()
-        body = (ws[f"B{i}"].value or "").strip()
-        status = (ws[f"C{i}"].value or "").strip().upper()
-        if title and body and status not in ("DONE", "PUBLISHED", "SKIP"):
-            return wb, ws, i, title, body
-    return wb, ws, None, None, None
-
-
-def mark_done(wb, ws, row: int):
-    ws[f"C{row}"] = "DONE"
-    ws[f"D{row}"] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-    wb.save(XLSX)
-
-
 # ──────────────────────────────
 # 공용 Selenium 헬퍼
 # ──────────────────────────────
-def wait_ready(drv, timeout: int = MAX_WAIT):
-    WebDriverWait(drv, timeout).until(
-        lambda d: d.execute_script("return document.readyState") == "complete"
+def wait_ready(drv, timeout: int = MAX_WAIT, interactive: bool = False):
+    """문서 로드 대기. interactive=True면 DOM 파싱 완료 시점에 바로 반환.
+
+    'complete'는 이미지/폰트/iframe까지 다 받은 뒤에야 떨어지므로,
+    폼 DOM만 필요한 글쓰기 진입에서는 'interactive'로 수 초를 아낀다.
+    """
+    states = ("interactive", "complete") if interactive else ("complete",)
+    WebDriverWait(drv, timeout, poll_frequency=0.1).until(
+        lambda d: d.execute_script("return document.readyState") in states
     )
 
 
 def accept_all_alerts(drv, max_loops: int = 5):
-    """열려있는 JS alert/confirm이 있으면 전부 수락."""
+    """열려있는 JS alert/confirm이 있으면 전부 수락.
+
+    switch_to.alert는 알럿이 없으면 즉시 예외로 빠지므로 폴링/고정 sleep이 필요 없다.
+    연쇄 알럿(수락 직후 다음 알럿)도 다음 루프의 switch_to가 바로 잡는다.
+    """
     for _ in range(max_loops):
         try:
             a = drv.switch_to.alert
@@ -88,49 +72,141 @@ def accept_all_alerts(drv, max_loops: int = 5):
             except Exception:
                 pass
             log(f"⚠ 알럿 감지 → 자동 수락: {txt}")
-            time.sleep(0.6)
         except Exception:
             break
 
 
-def safe_get(drv, url: str, timeout: int = MAX_WAIT):
+def safe_get(drv, url: str, timeout: int = MAX_WAIT, interactive: bool = False):
     drv.get(url)
     try:
-        wait_ready(drv, timeout)
+        wait_ready(drv, timeout, interactive=interactive)
     finally:
         accept_all_alerts(drv)
 
 
+# CSS 후보 전체를 브라우저 안에서 한 번에 검사 — 후보 N개가 왕복 1회로 끝난다
+_FIRST_MATCH_JS = (
+    "for (const s of arguments[0]) {"
+    "  const e = document.querySelector(s);"
+    "  if (e) return [s, e];"
+    "}"
+    "return null;"
+)
+
+
+# 같은 게시판에서는 매번 같은 셀렉터가 이긴다 — 직전 승자를 기억해 다음 호출에 먼저 시도
+_SEL_CACHE: dict[tuple, str] = {}
+
+
 def find_first(drv, selectors: list[str], by: By = By.CSS_SELECTOR, wait_s: int = 8):
-    """selectors를 순회하며 첫 번째로 존재하는 요소를 반환."""
-    for sel in selectors:
-        try:
-            el = WebDriverWait(drv, wait_s).until(
-                EC.presence_of_element_located((by, sel))
-            )
-            return el, sel
-        except TimeoutException:
-            continue
-    raise NoSuchElementException(f"해당 셀렉터들을 찾을 수 없습니다: {selectors}")
+    """selectors 중 첫 번째로 존재하는 요소를 반환.
+
+    예전에는 후보마다 WebDriverWait(wait_s)를 따로 돌려 앞의 후보가 없으면
+    wait_s × N 초를 허비했다. 이제 전체 후보에 wait_s 하나만 적용하고,
+    CSS는 JS 1회 호출로, XPath는 find_elements 순회로 매 폴마다 전부 검사한다.
+    배치 모드에서는 직전에 맞았던 셀렉터를 맨 앞에 둬 첫 시도에 적중시킨다.
+    """
+    key = (by, tuple(selectors))
+    ordered = list(selectors)
+    winner = _SEL_CACHE.get(key)
+    if winner in ordered and ordered[0] != winner:
+        ordered.remove(winner)
+        ordered.insert(0, winner)
+
+    def _probe(d):
+        if by == By.CSS_SELECTOR:
+            hit = d.execute_script(_FIRST_MATCH_JS, ordered)
+            if hit:
+                return hit[1], hit[0]
+        else:
+            for sel in ordered:
+                els = d.find_elements(by, sel)
+                if els:
+                    return els[0], sel
+        return False
+
+    try:
+        el, sel = WebDriverWait(drv, wait_s, poll_frequency=0.25).until(_probe)
+        _SEL_CACHE[key] = sel
+        return el, sel
+    except TimeoutException:
+        raise NoSuchElementException(f"해당 셀렉터들을 찾을 수 없습니다: {selectors}")
 
 
 # ──────────────────────────────
 # 로그인 감지/시도
 # ──────────────────────────────
+# 셀렉터 후보는 전부 고정 — 호출마다 리스트를 다시 만들지 않도록 모듈 상수(튜플)로 둔다
+_ID_SELECTORS = (
+    "input[name='mb_id']",
+    "input#mb_id",
+    "input[name='login_id']",
+    "input#login_id",
+    "input[name='user_id']",
+    "input[name='id']",
+)
+_PW_SELECTORS = (
+    "input[name='mb_password']",
+    "input#mb_password",
+    "input[name='login_pw']",
+    "input#login_pw",
+    "input[name='user_pw']",
+    "input[name='password']",
+    "input[name='passwd']",
+)
+_LOGIN_BTN_XPATHS = (
+    "//button[contains(.,'로그인')]",
+    "//input[@type='submit' and (contains(@value,'로그인') or contains(@value,'login'))]",
+    "//a[contains(@onclick,'login') and contains(.,'로그인')]",
+)
+_TITLE_SELECTORS = (
+    "input[name='wr_subject']",
+    "input[name='subject']",
+    "input[name='title']",
+    "input[type='text']#wr_subject",
+    "#fboardform input[type='text']",
+)
+_BODY_TA_SELECTORS = (
+    "textarea[name='wr_content']",
+    "textarea#wr_content",
+    "textarea[name='content']",
+    "#fboardform textarea",
+    "textarea",
+)
+_SUBMIT_XPATHS = (
+    "//button[contains(.,'등록') or contains(.,'작성') or contains(.,'저장')]",
+    "//input[@type='submit']",
+    "//a[contains(@onclick,'write') and (contains(.,'등록') or contains(.,'작성'))]",
+)
+_WRITE_BTN_XPATHS = (
+    # 텍스트/아이콘 버튼
+    "//a[contains(.,'글쓰기') or contains(.,'작성')]",
+    "//button[contains(.,'글쓰기') or contains(.,'작성')]",
+    "//a[@class='btn' and (contains(.,'글쓰기') or contains(.,'작성'))]",
+    "//a[contains(@class,'write')]",
+)
+# 로그인 판정은 브라우저 쪽에서 수행하고 불리언만 돌려받는다.
+# (drv.page_source는 전체 DOM을 직렬화해 페이지당 수백 ms를 먹는다)
+_LOGIN_PROBE_JS = (
+    "return !!document.querySelector(\"a[href*='logout']\")"
+    " || (document.body ? document.body.innerText.indexOf('로그아웃') !== -1 : false);"
+)
+
+
 def is_logged_in(drv) -> bool:
     """상단 네비/페이지 어디서든 '로그아웃' 또는 logout 링크가 보이면 로그인 상태로 간주."""
     try:
-        # 빠른 텍스트 검사 (헤더/푸터 포함)
-        html = drv.page_source
-        if "로그아웃" in html or "logout" in html.lower():
-            return True
-        # 링크 형태
-        links = drv.find_elements(By.XPATH, "//a[contains(@href,'logout') or contains(.,'로그아웃')]")
-        return len(links) > 0
+        return bool(drv.execute_script(_LOGIN_PROBE_JS))
     except Exception:
         return False
 
 
+def _logged_in_after_alerts(drv) -> bool:
+    """WebDriverWait 콜백용: 알럿을 치우고 로그인 여부를 반환."""
+    accept_all_alerts(drv)
+    return is_logged_in(drv)
+
+
 def try_auto_login(drv, home_url: str = "https://zae-da.com/") -> bool:
     """환경변수 MALL_ID/MALL_PW를 사용해 자동 로그인 시도."""
     uid = os.getenv("MALL_ID", "").strip()
@@ -138,75 +214,61 @@ def try_auto_login(drv, home_url: str = "https://zae-da.com/") -> bool:
     if not uid or not pw:
         return False
 
-    # 홈 → '로그인' 클릭 (없으면 바로 로그인 폼으로 진입)
-    safe_get(drv, home_url)
-    time.sleep(0.8)
-
-    # 로그인 링크 찾아보기
+    # 이미 로그인 폼 위라면(write.php가 로그인 페이지로 돌려보낸 경우 등) 홈 경유를 생략
+    on_login_form = False
     try:
-        login_link, _ = find_first(
-            drv,
-            [
-                "//a[contains(.,'로그인')]",
-                "//a[contains(@href,'login') or contains(@href,'member/login')]",
-                "//button[contains(.,'로그인')]",
-            ],
-            by=By.XPATH,
-            wait_s=5,
+        on_login_form = bool(
+            drv.execute_script(
+                "return arguments[0].some(s => !!document.querySelector(s));",
+                list(_ID_SELECTORS),
+            )
         )
-        login_link.click()
-        time.sleep(0.8)
     except Exception:
-        # 링크 못 찾으면 혹시 이미 로그인 폼일 수 있으니 그대로 진행
         pass
 
-    wait_ready(drv)
-
-    # 아이디/비번 입력 필드 탐색
-    id_sels = [
-        "input[name='mb_id']",
-        "input#mb_id",
-        "input[name='login_id']",
-        "input#login_id",
-        "input[name='user_id']",
-        "input[name='id']",
-    ]
-    pw_sels = [
-        "input[name='mb_password']",
-        "input#mb_password",
-        "input[name='login_pw']",
-        "input#login_pw",
-        "input[name='user_pw']",
-        "input[name='password']",
-        "input[name='passwd']",
-    ]
-    btn_sels = [
-        "//button[contains(.,'로그인')]",
-        "//input[@type='submit' and (contains(@value,'로그인') or contains(@value,'login'))]",
-        "//a[contains(@onclick,'login') and contains(.,'로그인')]",
-    ]
+    if not on_login_form:
+        # 홈 → '로그인' 클릭 (없으면 바로 로그인 폼으로 진입)
+        safe_get(drv, home_url)
+
+        # 로그인 링크 찾아보기
+        try:
+            login_link, _ = find_first(
+                drv,
+                [
+                    "//a[contains(.,'로그인')]",
+                    "//a[contains(@href,'login') or contains(@href,'member/login')]",
+                    "//button[contains(.,'로그인')]",
+                ],
+                by=By.XPATH,
+                wait_s=5,
+            )
+            login_link.click()
+        except Exception:
+            # 링크 못 찾으면 혹시 이미 로그인 폼일 수 있으니 그대로 진행
+            pass
+
+        wait_ready(drv)
 
     try:
-        id_el, _ = find_first(drv, id_sels, By.CSS_SELECTOR, wait_s=6)
-        pw_el, _ = find_first(drv, pw_sels, By.CSS_SELECTOR, wait_s=6)
+        id_el, _ = find_first(drv, _ID_SELECTORS, By.CSS_SELECTOR, wait_s=6)
+        pw_el, _ = find_first(drv, _PW_SELECTORS, By.CSS_SELECTOR, wait_s=6)
         id_el.clear(); id_el.send_keys(uid)
         pw_el.clear(); pw_el.send_keys(pw)
 
         try:
-            btn, _ = find_first(drv, btn_sels, By.XPATH, wait_s=4)
+            btn, _ = find_first(drv, _LOGIN_BTN_XPATHS, By.XPATH, wait_s=4)
             btn.click()
         except Exception:
             # 엔터로 제출
             pw_el.submit()
 
-        # 로그인 결과 대기 (최대 20초)
-        for _ in range(20):
-            time.sleep(1.0)
-            accept_all_alerts(drv)
-            if is_logged_in(drv):
-                log("🔐 자동 로그인 성공")
-                return True
-        return False
+        # 로그인 결과 대기 (최대 20초, 상태 확인 즉시 반환)
+        try:
+            WebDriverWait(drv, 20, poll_frequency=0.5).until(_logged_in_after_alerts)
+            log("🔐 자동 로그인 성공")
+            return True
+        except TimeoutException:
+            return False
     except Exception:
         return False
 
@@ -214,21 +276,29 @@ def try_auto_login(drv, home_url: str = "https://zae-da.com/") -> bool:
 def wait_until_logged_in(drv, timeout_s: int = 180) -> bool:
     """수동 로그인(다른 창/현재 창) 완료를 텍스트로 감지. 키보드 입력 없이 폴링."""
     log("⏳ 로그인 감지 대기 중... (최대 3분)")
-    t0 = time.time()
-    while time.time() - t0 < timeout_s:
-        time.sleep(2.0)
-        accept_all_alerts(drv)
-        try:
-            if is_logged_in(drv):
-                log("🔓 로그인 감지됨")
-                return True
-        except Exception:
-            pass
-    return False
+    # 고정 2초 sleep 루프 대신 0.5초 폴링 — 로그인 직후 최대 2초 늦게 반응하던 것이 즉시 반환
+    try:
+        WebDriverWait(
+            drv, timeout_s, poll_frequency=0.5, ignored_exceptions=(WebDriverException,)
+        ).until(_logged_in_after_alerts)
+        log("🔓 로그인 감지됨")
+        return True
+    except TimeoutException:
+        return False
 
 
 def ensure_login(drv, list_url: str, write_url: str):
     """로그인 필요 시 자동 로그인 시도 → 실패하면 수동 로그인 감지."""
+    # 0) 프로필 쿠키가 살아있는 흔한 경우: 글쓰기 폼이 바로 뜨면 로그인 절차 전부 생략
+    #    (미로그인이면 gnuboard가 로그인 페이지로 리다이렉트하므로 폼 부재로 판별된다)
+    if write_url:
+        try:
+            safe_get(drv, write_url, interactive=True)
+            if "board_write.php" in drv.current_url and _has_write_form(drv):
+                return
+        except Exception:
+            pass
+
     # 1) 현재 로그인 상태면 바로 리턴
     try:
         accept_all_alerts(drv)
@@ -242,7 +312,14 @@ def ensure_login(drv, list_url: str, write_url: str):
         return
 
     # 3) 자동 실패 시: 리스트 페이지 오픈 후 '로그인' 유도, 수동 로그인 감지
-    safe_get(drv, list_url or "https://zae-da.com/")
+    #    (자동 로그인 시도가 이미 해당 페이지에 두고 갔으면 재이동 생략)
+    target = list_url or "https://zae-da.com/"
+    try:
+        already_there = drv.current_url.rstrip("/") == target.rstrip("/")
+    except Exception:
+        already_there = False
+    if not already_there:
+        safe_get(drv, target)
     log("👉 로그인 페이지로 이동해 수동 로그인 해주세요. (최대 3분 내 자동 감지)")
     if not wait_until_logged_in(drv, timeout_s=180):
         raise RuntimeError("로그인을 감지하지 못했습니다. 로그인 후 다시 실행해주세요.")
@@ -260,112 +337,218 @@ def board_id_from_url(url: str) -> str | None:
         return None
 
 
+# 글쓰기 버튼 후보 전체를 브라우저 안에서 검사하고, 찾는 즉시 같은 왕복에서 클릭까지 수행.
+# (후보마다 WebDriverWait(8초)를 따로 돌리면 첫 후보가 없을 때 8초×N을 허비한다)
+_CLICK_FIRST_JS = (
+    "for (const s of arguments[0]) {"
+    "  const el = s.startsWith('//')"
+    "    ? document.evaluate(s, document, null, 9, null).singleNodeValue"
+    "    : document.querySelector(s);"
+    "  if (el) { el.scrollIntoView({block: 'center'}); el.click(); return s; }"
+    "}"
+    "return null;"
+)
+
+
 def goto_write_from_list(drv, list_url: str, boardid: str | None) -> bool:
-    safe_get(drv, list_url)
+    # 글쓰기 버튼만 찾으면 되므로 서브리소스 로드 완료까지 기다리지 않음
+    safe_get(drv, list_url, interactive=True)
     # 리스트에서 '글쓰기' 버튼 또는 write.php 링크 찾기
-    candidates = [
-        # 직접 링크
-        f"//a[contains(@href,'board_write.php') and contains(@href,'boardid={boardid}')]" if boardid else "",
-        # 텍스트/아이콘 버튼
-        "//a[contains(.,'글쓰기') or contains(.,'작성')]",
-        "//button[contains(.,'글쓰기') or contains(.,'작성')]",
-        "//a[@class='btn' and (contains(.,'글쓰기') or contains(.,'작성'))]",
-        "//a[contains(@class,'write')]",
-    ]
-    candidates = [c for c in candidates if c]
-
-    for xpath in candidates:
-        try:
-            btn = WebDriverWait(drv, 8).until(EC.element_to_be_clickable((By.XPATH, xpath)))
-            btn.click()
-            time.sleep(0.8)
-            wait_ready(drv)
-            accept_all_alerts(drv)
-            # write 페이지 판단: URL 또는 제목 필드 존재
-            if "board_write.php" in drv.current_url:
-                return True
-            # 필드 존재 확인
-            _ = find_first(drv, ["input[name='wr_subject']", "input[name='subject']", "input[name='title']"], By.CSS_SELECTOR, 3)
+    # 고정 후보는 모듈 상수, boardid 전용 직접 링크만 호출 시 앞에 붙인다
+    if boardid:
+        candidates = (
+            f"//a[contains(@href,'board_write.php') and contains(@href,'boardid={boardid}')]",
+        ) + _WRITE_BTN_XPATHS
+    else:
+        candidates = _WRITE_BTN_XPATHS
+
+    # 전체 후보를 폴마다 JS 1회로 검사+클릭 — 총 대기 상한은 후보 수와 무관하게 8초
+    try:
+        WebDriverWait(drv, 8, poll_frequency=0.25).until(
+            lambda d: d.execute_script(_CLICK_FIRST_JS, list(candidates))
+        )
+    except UnexpectedAlertPresentException:
+        accept_all_alerts(drv)
+        # 권한 알럿이면 로그인 시도 후 재시도
+        ensure_login(drv, list_url, "")
+        return goto_write_from_list(drv, list_url, boardid)
+    except TimeoutException:
+        return False
+
+    wait_ready(drv, interactive=True)
+    accept_all_alerts(drv)
+    # write 페이지 판단: URL 또는 제목 필드 존재
+    return "board_write.php" in drv.current_url or _has_write_form(drv)
+
+
+def _has_write_form(drv) -> bool:
+    """제목 입력 필드가 이미 떠 있는지 JS 1회로 확인 (요소 탐색/대기 없이 불리언만)."""
+    try:
+        return bool(
+            drv.execute_script(
+                "return arguments[0].some(s => !!document.querySelector(s));",
+                list(_TITLE_SELECTORS),
+            )
+        )
+    except Exception:
+        return False
+
+
+def _direct_write_ok(drv, write_url: str) -> bool | None:
+    """write.php 직접 접근 가능 여부를 크롬 내비게이션 없이 HEAD 1회로 예측.
+
+    드라이버의 쿠키를 requests 세션에 복사해 확인 — 리스트 페이지 렌더링(수 초)
+    대신 수 KB 왕복으로 리스트→버튼 경로를 건너뛸 수 있는지 판단한다.
+    200이면 True, 로그인으로 리다이렉트면 False, 판정 불가(오류 등)면 None.
+    """
+    try:
+        import requests
+
+        s = requests.Session()
+        for c in drv.get_cookies():
+            s.cookies.set(c["name"], c["value"], domain=c.get("domain"))
+        r = s.head(write_url, allow_redirects=False, timeout=3)
+        if r.status_code == 200:
             return True
-        except UnexpectedAlertPresentException:
-            accept_all_alerts(drv)
-            # 권한 알럿이면 로그인 시도 후 재시도
-            ensure_login(drv, list_url, "")
-            return goto_write_from_list(drv, list_url, boardid)
-        except Exception:
-            continue
-    return False
+        if "login" in r.headers.get("Location", "").lower():
+            return False
+        return None
+    except Exception:
+        return None
 
 
 def ensure_write_page(drv, list_url: str, write_url: str):
     """리스트→버튼 클릭 우선, 실패 시 write.php 직접 진입."""
     bid = board_id_from_url(write_url)
-    # A) 이미 write 페이지면 통과
+    # A) 이미 write 페이지면 통과 (URL 불일치여도 폼이 떠 있으면 통과)
     try:
-        if "board_write.php" in drv.current_url:
+        if "board_write.php" in drv.current_url or _has_write_form(drv):
             return
     except Exception:
         pass
 
+    # A-2) HEAD 로 직접 진입이 열려 있다고 확인되면 리스트 경유(페이지 로드 1회)를 생략
+    if _direct_write_ok(drv, write_url):
+        safe_get(drv, write_url, interactive=True)
+        if "board_write.php" in drv.current_url and _has_write_form(drv):
+            log("✅ 글쓰기 페이지(직접 URL, HEAD 사전 확인) 진입 성공")
+            return
+
     # B) 리스트에서 글쓰기 버튼 클릭 시도
     if list_url and goto_write_from_list(drv, list_url, bid):
         log("✅ 글쓰기 페이지(리스트→버튼) 진입 성공")
         return
 
     # C) write.php 직접 오픈 (미로그인/권한 알럿이면 처리 후 재시도)
-    safe_get(drv, write_url)
-    if "board_write.php" not in drv.current_url:
+    # current_url 도 매번 와이어 왕복 — 네비게이션 직후 한 번만 읽어 재사용
+    safe_get(drv, write_url, interactive=True)
+    cur = drv.current_url
+    if "board_write.php" not in cur:
         # 권한 문제 등으로 리다이렉트 되었을 수 있음 → 로그인 보장 후 재시도
         ensure_login(drv, list_url or "https://zae-da.com/bbs/list.php?boardid=" + (bid or ""), write_url)
-        safe_get(drv, write_url)
+        safe_get(drv, write_url, interactive=True)
+        cur = drv.current_url
 
-    if "board_write.php" not in drv.current_url:
+    if "board_write.php" not in cur:
         raise RuntimeError("글쓰기 페이지로 진입하지 못했습니다.")
 
 
 # ──────────────────────────────
 # 입력/제출
 # ──────────────────────────────
+# send_keys는 글자당 와이어 왕복이라 긴 본문에서 수천 회가 된다.
+# 네이티브 value setter를 호출해 프레임워크 감시 필드에서도 이벤트가 살아있게 한다.
+_SET_VALUE_JS = (
+    "const e = arguments[0], v = arguments[1];"
+    "const proto = e.tagName === 'TEXTAREA'"
+    "  ? window.HTMLTextAreaElement.prototype : window.HTMLInputElement.prototype;"
+    "Object.getOwnPropertyDescriptor(proto, 'value').set.call(e, v);"
+    "e.dispatchEvent(new Event('input', {bubbles: true}));"
+    "e.dispatchEvent(new Event('change', {bubbles: true}));"
+)
+
+
+def set_input_value(drv, el, text: str):
+    drv.execute_script(_SET_VALUE_JS, el, text)
+
+
+# 제목 탐색→입력→본문 탐색→입력(왕복 4회 이상)을 한 번의 execute_script 로 융합.
+# 본문 대상(텍스트영역/에디터)을 먼저 확정한 뒤에야 제목을 넣으므로 반쪽 입력이 없다.
+# iframe 기반 에디터는 프레임 전환이 필요해 여기서 처리하지 않고 null 을 돌려준다.
+_FILL_FORM_JS = (
+    "const [title, body, bodyHtml, titleSels, taSels] = arguments;"
+    "let ti = null;"
+    "for (const s of titleSels) { ti = document.querySelector(s); if (ti) break; }"
+    "if (!ti) return null;"
+    "const setVal = (el, v) => {"
+    "  const proto = el.tagName === 'TEXTAREA'"
+    "    ? window.HTMLTextAreaElement.prototype : window.HTMLInputElement.prototype;"
+    "  Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, v);"
+    "  el.dispatchEvent(new Event('input', {bubbles: true}));"
+    "  el.dispatchEvent(new Event('change', {bubbles: true}));"
+    "};"
+    "for (const s of taSels) {"
+    "  const ta = document.querySelector(s);"
+    "  if (ta) { setVal(ti, title); setVal(ta, body); return 'textarea'; }"
+    "}"
+    "const ed = document.querySelector(\"div[contenteditable='true']\");"
+    "if (ed) { setVal(ti, title); ed.innerHTML = bodyHtml; return 'contenteditable'; }"
+    "return null;"
+)
+
+
+def fill_form(drv, title: str, body: str):
+    """제목+본문 입력을 JS 1회로 시도, 안 되는 에디터면 기존 개별 경로로 폴백."""
+    global _editor_hint
+    # HTML 변환은 어느 분기로 가든 한 번만 수행해 폴백 경로에 그대로 전달
+    body_html = body.replace("\r", "").replace("\n", "<br>")
+    try:
+        kind = drv.execute_script(
+            _FILL_FORM_JS, title, body, body_html,
+            list(_TITLE_SELECTORS), list(_BODY_TA_SELECTORS),
+        )
+    except Exception:
+        kind = None
+    if kind:
+        _editor_hint = kind
+        log(f"제목/본문 입력 완료 ✓ ({kind})")
+        return
+    # iframe 에디터 등 — 프레임 전환이 필요한 경우는 단계별 경로가 담당
+    fill_title(drv, title)
+    fill_body(drv, body, body_html)
+
+
 def fill_title(drv, title: str):
-    inputs = [
-        "input[name='wr_subject']",
-        "input[name='subject']",
-        "input[name='title']",
-        "input[type='text']#wr_subject",
-    ]
-    ti, sel = find_first(drv, inputs, By.CSS_SELECTOR, wait_s=10)
-    ti.clear()
-    ti.send_keys(title)
+    ti, sel = find_first(drv, _TITLE_SELECTORS, By.CSS_SELECTOR, wait_s=10)
+    set_input_value(drv, ti, title)
     log("제목 입력 완료 ✓")
 
 
-def fill_body(drv, body: str):
-    """textarea → contenteditable → iframe 순으로 시도."""
-    # 1) textarea
+# 같은 게시판은 글마다 에디터가 바뀌지 않는다 — 성공한 방식을 기억해 다음 글은 바로 그 분기로
+_editor_hint: str | None = None
+
+
+def _fill_body_textarea(drv, body: str, body_html: str, wait_s: int) -> bool:
     try:
-        ta, _ = find_first(
-            drv,
-            ["textarea[name='wr_content']", "textarea[name='content']", "textarea#wr_content", "textarea"],
-            By.CSS_SELECTOR,
-            wait_s=4,
-        )
-        ta.clear()
-        ta.send_keys(body)
+        ta, _ = find_first(drv, _BODY_TA_SELECTORS, By.CSS_SELECTOR, wait_s=wait_s)
+        set_input_value(drv, ta, body)
         log("본문 입력 완료 ✓ (textarea)")
-        return
+        return True
     except Exception:
-        pass
+        return False
 
-    # 2) contenteditable
+
+def _fill_body_contenteditable(drv, body: str, body_html: str, wait_s: int) -> bool:
     try:
-        ed, _ = find_first(drv, ["div[contenteditable='true']"], By.CSS_SELECTOR, wait_s=3)
-        drv.execute_script("arguments[0].innerHTML = arguments[1];", ed, body.replace("\n", "<br>"))
+        ed, _ = find_first(drv, ["div[contenteditable='true']"], By.CSS_SELECTOR, wait_s=wait_s)
+        drv.execute_script("arguments[0].innerHTML = arguments[1];", ed, body_html)
         log("본문 입력 완료 ✓ (contenteditable)")
-        return
+        return True
     except Exception:
-        pass
+        return False
 
-    # 3) iframe 에디터들 순회
+
+def _fill_body_iframe(drv, body: str, body_html: str, wait_s: int = 0) -> bool:
     iframes = drv.find_elements(By.TAG_NAME, "iframe")
     for idx, ifr in enumerate(iframes):
         try:
@@ -376,32 +559,59 @@ def fill_body(drv, body: str):
                 if editable:
                     el = editable[0]
                     # body의 경우 .innerHTML 세팅
-                    drv.execute_script("arguments[0].innerHTML = arguments[1];", el, body.replace("\n", "<br>"))
+                    drv.execute_script("arguments[0].innerHTML = arguments[1];", el, body_html)
                     log(f"본문 입력 완료 ✓ (iframe #{idx})")
                     drv.switch_to.default_content()
-                    return
+                    return True
             finally:
                 drv.switch_to.default_content()
         except Exception:
             drv.switch_to.default_content()
             continue
+    return False
+
+
+_BODY_FILLERS = {
+    "textarea": _fill_body_textarea,
+    "contenteditable": _fill_body_contenteditable,
+    "iframe": _fill_body_iframe,
+}
+
+
+def fill_body(drv, body: str, body_html: str | None = None):
+    """textarea → contenteditable → iframe 순으로 시도. 성공 분기는 다음 글에 우선 적용."""
+    global _editor_hint
+    if body_html is None:
+        body_html = body.replace("\r", "").replace("\n", "<br>")
+    order = ["textarea", "contenteditable", "iframe"]
+    if _editor_hint in order and order[0] != _editor_hint:
+        order.remove(_editor_hint)
+        order.insert(0, _editor_hint)
+
+    for kind in order:
+        # 첫 순위(힌트 또는 기본)는 정상 대기, 나머지 폴백은 짧게
+        wait_s = 4 if kind == order[0] else 2
+        if _BODY_FILLERS[kind](drv, body, body_html, wait_s):
+            _editor_hint = kind
+            return
 
     raise NoSuchElementException("본문 입력 영역을 찾지 못했습니다. (textarea/contenteditable/iframe 불가)")
 
 
 def submit_post(drv):
     # 등록/작성/저장 버튼
-    sels = [
-        "//button[contains(.,'등록') or contains(.,'작성') or contains(.,'저장')]",
-        "//input[@type='submit']",
-        "//a[contains(@onclick,'write') and (contains(.,'등록') or contains(.,'작성'))]",
-    ]
-    for xp in sels:
+    for xp in _SUBMIT_XPATHS:
         try:
-            btn = WebDriverWait(drv, 6).until(EC.element_to_be_clickable((By.XPATH, xp)))
+            # 기본 폴링 500ms는 로컬 크롬엔 과하게 길다 — 발견 지연 중앙값을 ~50ms로
+            btn = WebDriverWait(drv, 6, poll_frequency=0.1).until(
+                EC.element_to_be_clickable((By.XPATH, xp))
+            )
             btn.click()
-            time.sleep(0.8)
             accept_all_alerts(drv)
+            try:
+                wait_ready(drv, 10)
+            except Exception:
+                pass
             log("등록 버튼 클릭 ✓")
             return
         except Exception:
@@ -415,12 +625,27 @@ def submit_post(drv):
 def setup_driver() -> Chrome:
     load_dotenv()  # .env 읽기
 
+    # 실행 간 세션 재사용: 미리 띄워 둔 크롬(--remote-debugging-port=9222)에 붙는다.
+    # 예) .env: CHROME_DEBUGGER_ADDRESS=127.0.0.1:9222
+    # 크롬 기동/프로필 잠금/로그인 과정을 전부 건너뛰므로 반복 실행이 가장 빠르다.
+    debugger = os.getenv("CHROME_DEBUGGER_ADDRESS", "").strip()
+    if debugger:
+        opts = ChromeOptions()
+        opts.page_load_strategy = "eager"
+        opts.add_experimental_option("debuggerAddress", debugger)
+        drv = Chrome(service=resolve_service(), options=opts)
+        log(f"[chrome] attached to running instance: {debugger}")
+        return drv
+
     user_data_dir = os.getenv("CHROME_USER_DATA_DIR", "").strip()
     profile_dir   = os.getenv("CHROME_PROFILE", "").strip()
     fallback_dir  = os.getenv("CHROME_FALLBACK_DIR", "").strip()
 
     def _make_options(ud: str | None, prof: str | None) -> ChromeOptions:
         opts = ChromeOptions()
+        # drv.get()이 load 이벤트가 아닌 DOMContentLoaded 시점에 반환 — 모든 내비게이션에서
+        # 트레일링 서브리소스 대기를 제거한다 (이후 wait_ready(interactive)는 즉시 통과)
+        opts.page_load_strategy = "eager"
         if ud:
             opts.add_argument(f"--user-data-dir={ud}")
         if prof:
@@ -428,17 +653,32 @@ def setup_driver() -> Chrome:
             opts.add_argument(f"--profile-directory={prof}")
 
         # 안정화 옵션 (Windows)
-        opts.add_argument("--start-maximized")
+        # HEADLESS=1 이면 렌더링 파이프라인 없이 실행 (수동 로그인이 필요할 땐 끌 것)
+        if os.getenv("HEADLESS", "").strip() == "1":
+            opts.add_argument("--headless=new")
+            opts.add_argument("--window-size=1280,1024")
+        else:
+            opts.add_argument("--start-maximized")
         opts.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
         opts.add_experimental_option("useAutomationExtension", False)
         # 암시적 크래시 방지용(불필요한 경우도 있으나 무해)
         opts.add_argument("--disable-notifications")
         opts.add_argument("--disable-popup-blocking")
 
+        # 성능: 봇은 이미지를 볼 필요가 없음 (LOAD_IMAGES=1 로 다시 허용)
+        prefs = {"profile.default_content_setting_values.notifications": 2}
+        if os.getenv("LOAD_IMAGES", "").strip() != "1":
+            opts.add_argument("--blink-settings=imagesEnabled=false")
+            prefs["profile.managed_default_content_settings.images"] = 2
+        opts.add_experimental_option("prefs", prefs)
+
         return opts
 
     def _launch(opts: ChromeOptions) -> Chrome:
-        return Chrome(service=Service(ChromeDriverManager().install()), options=opts)
+        drv = Chrome(service=resolve_service(), options=opts)
+        remember_driver_path(drv)
+        install_network_blocklist(drv)
+        return drv
 
     # 1차: 환경변수의 실제 프로필로 시도
     try:
@@ -463,39 +703,49 @@ def setup_driver() -> Chrome:
 # ──────────────────────────────
 # 메인
 # ──────────────────────────────
-def main():
+def main(argv: list[str] | None = None):
     load_dotenv()
     ap = argparse.ArgumentParser()
     ap.add_argument("--url", required=True, help="글쓰기 폼 URL 예) https://zae-da.com/m/bbs/board_write.php?boardid=41")
     ap.add_argument("--list-url", default=None, help="게시판 리스트 URL 예) https://zae-da.com/bbs/list.php?boardid=41")
-    args = ap.parse_args()
+    ap.add_argument("--batch", type=int, default=1, help="한 크롬 세션에서 연속 업로드할 최대 건수 (0=대기 건 전부)")
+    args = ap.parse_args(argv)
 
     # 엑셀에서 1건 꺼내오기
-    wb, ws, row, title, body = load_next_row()
+    row, title, body = load_next_row()
     if not row:
         log("대기 중인 업로드 건이 없습니다.")
         return
 
-    # 크롬 구동
+    # 크롬 구동 — 드라이버/로그인 비용은 배치 전체에 1회만 지불
     drv = setup_driver()
+    done_rows: list[int] = []
     try:
         # 권한 알럿/미로그인 대비: 글쓰기 전 로그인 보장
         list_url = args.list_url or "https://zae-da.com"  # 최소 홈이라도 전달
         ensure_login(drv, list_url, args.url)
 
-        # 글쓰기 페이지 진입 (리스트→버튼 우선, 실패 시 직접 진입)
-        ensure_write_page(drv, args.list_url, args.url)
+        uploaded = 0
+        while row and (args.batch == 0 or uploaded < args.batch):
+            # 글쓰기 페이지 진입 (리스트→버튼 우선, 실패 시 직접 진입)
+            ensure_write_page(drv, args.list_url, args.url)
 
-        # 제목/본문 입력
-        fill_title(drv, title)
-        fill_body(drv, body)
+            # 제목/본문 입력 (가능하면 JS 1회로 일괄 처리)
+            fill_form(drv, title, body)
 
-        # 제출
-        submit_post(drv)
+            # 제출
+            submit_post(drv)
 
-        # 완료 처리
-        mark_done(wb, ws, row)
-        log("✅ 업로드 완료 → DONE 처리")
+            # 완료 처리는 모아서 세션 종료 시 1회 저장 (행당 워크북 재저장 방지)
+            done_rows.append(row)
+            uploaded += 1
+            log(f"✅ 업로드 완료 ({uploaded}/{args.batch or '∞'})")
+
+            row = None
+            if args.batch == 0 or uploaded < args.batch:
+                row, title, body = load_next_row(skip_rows=done_rows)
+                if not row:
+                    log("대기 중인 업로드 건을 모두 처리했습니다.")
     except UnexpectedAlertPresentException:
         # 권한/세션 알럿 등: 가능한 한 수락하고 종료
         try:
@@ -505,6 +755,13 @@ def main():
         log("❌ 알럿으로 인해 제출이 중단되었습니다.")
         raise
     finally:
+        # 업로드가 끝난 행은 실패/중단 여부와 무관하게 반드시 DONE 으로 남긴다
+        try:
+            mark_done_many(done_rows)
+            if done_rows:
+                log(f"DONE 기록 완료 ({len(done_rows)}건)")
+        except Exception as e:
+            log(f"⚠ DONE 기록 실패: {e} (행: {done_rows})")
         try:
             # 닫지 않고 남겨두고 싶으면 주석 처리
             drv.quit()
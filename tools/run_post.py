@@ -10,7 +10,7 @@
 """
 
 from __future__ import annotations
-import os, subprocess, sys
+import os, sys
 from pathlib import Path
 
 ROOT  = Path(__file__).resolve().parent.parent
@@ -18,11 +18,24 @@ TOOLS = ROOT / "tools"
 DOCS  = ROOT / "docs"
 XLSX  = DOCS / "data.xlsx"
 
+# 각 단계를 subprocess 로 띄우면 파이썬 기동 + openpyxl/selenium 재임포트를
+# 단계마다 다시 지불한다 — 같은 프로세스에서 main(argv) 직접 호출로 대체
+if str(TOOLS) not in sys.path:
+    sys.path.insert(0, str(TOOLS))
+import make_sample_data
+import create_contents
+import mall_auto_write
+
 DEFAULT_URL = "https://zae-da.com/m/bbs/board_write.php?boardid=41"
 
-def run(cmd: list[str], check=True):
-    print("▶", " ".join(str(c) for c in cmd), flush=True)
-    return subprocess.run(cmd, check=check)
+def run(step_main, argv: list[str]):
+    print("▶", step_main.__module__, " ".join(argv), flush=True)
+    try:
+        step_main(argv)
+    except SystemExit as e:
+        # argparse 오류 등 0이 아닌 종료는 subprocess 시절(check=True)처럼 전파
+        if e.code not in (0, None):
+            raise
 
 def main():
     print("🚀 원클릭 재다몰 업로드 시작")
@@ -34,13 +47,13 @@ def main():
     # 1) 데이터 파일 없으면 생성
     if not XLSX.exists():
         DOCS.mkdir(exist_ok=True)
-        run([sys.executable, str(TOOLS/"make_sample_data.py"), "--rows", "1"])
+        run(make_sample_data.main, [])
 
     # 2) 본문 비어있는 행 채우기
-    run([sys.executable, str(TOOLS/"create_contents.py"), "--only-empty"])
+    run(create_contents.main, ["--only-empty"])
 
     # 3) 실제 업로드 실행 (독립 세션)
-    run([sys.executable, str(TOOLS/"mall_auto_write.py"), "--url", write_url])
+    run(mall_auto_write.main, ["--url", write_url])
 
     print("✅ 종료")
 